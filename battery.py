@@ -21,10 +21,10 @@ Command Structure:
     - Byte 7: Checksum
 
 Response Data Mapping (Battery Info - Command 0x13):
-    - Bytes 8-11: Pack voltage (mV, little-endian, reversed)
-    - Bytes 12-15: Voltage reading (mV, little-endian, reversed)
+    - Bytes 8-11: Pack voltage (mV, little-endian)
+    - Bytes 12-15: Voltage reading (mV, little-endian)
     - Bytes 16-47: Individual cell voltages (2 bytes each, up to 16 cells)
-    - Bytes 48-51: Current (mA, signed, little-endian, reversed)
+    - Bytes 48-51: Current (mA, signed, little-endian)
     - Bytes 52-53: Cell temperature (°C, signed)
     - Bytes 54-55: MOSFET temperature (°C, signed)
     - Bytes 62-63: Remaining capacity (Ah * 100)
@@ -51,12 +51,92 @@ Note:
 """
 
 import json
+import zlib
+import struct
 import asyncio
 import logging
+import functools
 from typing import Callable, Any
 from bleak import BleakError
 from request import Request
 
+try:
+    import orjson
+except ImportError:  ## optional, faster JSON serialization
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+## Little-endian layout of the GET_BATTERY_INFO payload starting at byte 8,
+## see "Response Data Mapping" above. Padding (x) skips reserved bytes,
+## failure flags are kept as raw bytes (4s).
+_BATTERY_INFO = struct.Struct("<II16Hihh6xHH2xI4xI4sIHHIII")
+## GET_VERSION payload from byte 8: major, minor, patch, year, month, day
+_VERSION = struct.Struct("<4H2B")
+## Bytes outside printable ASCII (32-126), dropped from the hardware version
+_NON_PRINTABLE = bytes(range(32)) + bytes(range(127, 256))
+
+## zlib.adler32 keeps 1 + sum(bytes) in its low 16 bits while that stays below
+## its modulus 65521, which holds for up to 256 bytes (1 + 255 * 256 = 65281)
+_ADLER_SUM_MAX_LEN = 256
+
+## Human readable status messages
+_BALANCE_OK = "All cells are well-balanced."
+_BALANCE_ACTIVE = "Battery cells are being balanced for better performance."
+_CELL_OK = "Battery is in optimal working condition."
+_CELL_FAULT = "Fault alert! There may be a problem with cell."
+_HEAT_OFF = "Self-heating is off"
+_HEAT_ON = "Self-heating is on"
+
+## Battery statuses indexed by the sign of the current (-1, 0, 1) + 1
+_BATTERY_STATUS = ("Discharging", "Standby", "Charging")
+_FULL_CHARGE = "Full Charge"
+
+## Statuses indexed by the boolean state they describe
+_BALANCE_STATUS = (_BALANCE_OK, _BALANCE_ACTIVE)
+_CELL_STATUS = (_CELL_OK, _CELL_FAULT)
+_HEAT_STATUS = (_HEAT_OFF, _HEAT_ON)
+
+## Attributes serialized by get_json(), in output order
+_JSON_FIELDS = (
+    "packVoltage",
+    "voltage",
+    "batteryPack",
+    "current",
+    "watt",
+    "remainAh",
+    "factoryAh",
+    "cellTemperature",
+    "mosfetTemperature",
+    "heat",
+    "protectState",
+    "failureState",
+    "equilibriumState",
+    "batteryState",
+    "SOC",
+    "SOH",
+    "dischargeSwitchState",
+    "dischargesCount",
+    "dischargesAHCount",
+    "firmwareVersion",
+    "manfactureDate",
+    "hardwareVersion",
+    "battery_status",
+    "balance_status",
+    "cell_status",
+    "bms_status",
+    "heat_status",
+    "error_code",
+    "error_message",
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not support natively."""
+    if isinstance(obj, bytes):
+        return list(obj)
+    return obj.__dict__
+
 
 class BatteryInfo:
     """
@@ -91,8 +171,9 @@ class BatteryInfo:
             Contains self-heating control status and discharge switch state.
         protectState (str | None): Protection status flags as hexadecimal string.
             Indicates active protection features (over-voltage, under-voltage, etc.).
-        failureState (list | None): List of failure state bytes.
-            Non-zero values indicate active faults.
+        failureState (bytes | None): Failure state bytes.
+            Non-zero values indicate active faults. Serialized as a list
+            of integers by get_json().
         equilibriumState (int | None): Cell balancing/equilibrium state.
             Non-zero indicates active cell balancing.
         batteryState (int | None): Current battery operational state.
@@ -124,6 +205,11 @@ class BatteryInfo:
         ERROR_BLEAK (int): Error code 4 - Bleak library error.
         ERROR_CHECKSUM (int): Error code 6 - CRC checksum mismatch.
 
+    Note:
+        Instances use __slots__ to keep their memory footprint small when
+        many batteries are monitored; attributes not listed above cannot
+        be added to an instance.
+
     Example:
         >>> battery = BatteryInfo("12:34:56:78:AA:CC", pair_device=True, timeout=5)
         >>> battery.read_bms()
@@ -135,18 +221,55 @@ class BatteryInfo:
         ...     print(f"Error: {battery.error_message}")
     """
 
+    __slots__ = (
+        "packVoltage",
+        "voltage",
+        "batteryPack",
+        "_current_mA",
+        "remainAh",
+        "factoryAh",
+        "cellTemperature",
+        "mosfetTemperature",
+        "heat",
+        "protectState",
+        "failureState",
+        "equilibriumState",
+        "batteryState",
+        "SOC",
+        "SOH",
+        "dischargeSwitchState",
+        "dischargesCount",
+        "dischargesAHCount",
+        "firmwareVersion",
+        "manfactureDate",
+        "hardwareVersion",
+        "battery_status",
+        "balance_status",
+        "cell_status",
+        "bms_status",
+        "heat_status",
+        "error_code",
+        "_error",
+        "_debug",
+        "_logger",
+        "_request",
+    )
+
     BMS_CHARACTERISTIC_ID = (
         "0000FFE1-0000-1000-8000-00805F9B34FB"  ## Bluetooth characteristic for BMS data
     )
     SN_CHARACTERISTIC_ID = "0000FFE2-0000-1000-8000-00805F9B34FB"  ## characteristic for reading serial number (seems not implemented)
 
-    pq_commands = {
-        "GET_VERSION": "00 00 04 01 16 55 AA 1A",
-        "GET_BATTERY_INFO": "00 00 04 01 13 55 AA 17",
+    ## Command frames by command ID, ready to be written to the characteristic
+    _PQ_CMD_BYTES = {
+        "GET_VERSION": Request.make_command(0x16),
+        "GET_BATTERY_INFO": Request.make_command(0x13),
         ## Native application does not read internal serial number.
         ## On version 1.1.4 used SN from QR code, during adding battery
-        "SERIAL_NUMBER": "00 00 04 01 10 55 AA 14",
+        "SERIAL_NUMBER": Request.make_command(0x10),
     }
+    ## The same commands as hex strings, e.g. "00 00 04 01 16 55 AA 1A"
+    pq_commands = {name: cmd.hex(" ").upper() for name, cmd in _PQ_CMD_BYTES.items()}
 
     ERROR_GENERIC = 1
     ERROR_TIMEOUT = 2
@@ -213,8 +336,7 @@ class BatteryInfo:
         self.packVoltage = None
         self.voltage = None
         self.batteryPack: dict = {}
-        self.current = None
-        self.watt = None
+        self._current_mA = None
         self.remainAh = None
         self.factoryAh = None
         self.cellTemperature = None
@@ -243,14 +365,12 @@ class BatteryInfo:
 
         ## Error handling
         self.error_code = 0
-        self.error_message = None
+        ## Message or (exception name, message) behind error_message
+        self._error = None
 
         self._debug = False
 
-        if logger:
-            self._logger = logger
-        else:
-            self._logger = logging.getLogger(__name__)
+        self._logger = logger or _LOGGER
 
         self._request = Request(
             bluetooth_device_mac,
@@ -259,6 +379,54 @@ class BatteryInfo:
             logger=self._logger,
         )
 
+    @property
+    def current(self) -> float | None:
+        """
+        Current flow in Amperes, rounded to 2 decimals.
+
+        Positive values indicate charging, negative values discharging.
+        Computed on access from the raw milliamp reading; None until
+        read_bms() has parsed a battery info response.
+        """
+        if self._current_mA is None:
+            return None
+        return round(self._current_mA / 1000, 2)
+
+    @current.setter
+    def current(self, amperes: float | None) -> None:
+        self._current_mA = None if amperes is None else round(amperes * 1000)
+
+    @property
+    def watt(self) -> float | None:
+        """
+        Calculated power in Watts (voltage * current / 1000000), rounded to
+        2 decimals. Positive for charging power, negative for discharge power.
+        Read-only, always derived from voltage and current.
+        """
+        if self.voltage is None or self._current_mA is None:
+            return None
+        return round(self.voltage * self._current_mA / 1000000, 2)
+
+    @property
+    def error_message(self) -> str | None:
+        """
+        Human readable error message if error_code != 0.
+
+        Exceptions caught by read_bms() are stored as name and message only
+        and formatted here, when the message is actually read.
+        """
+        error = self._error
+        if error is None or isinstance(error, str):
+            return error
+        name, message = error
+        if self.error_code == self.ERROR_GENERIC:
+            return message
+        return f"{name}: {message}"
+
+    @error_message.setter
+    def error_message(self, message: str | None) -> None:
+        self._error = message
+
     @staticmethod
     def _check_crc(func: Callable[..., Any]) -> Callable[..., Any]:
         """
@@ -300,17 +468,27 @@ class BatteryInfo:
             ...     # CRC is verified before this code runs
             ...     self.value = data[0]
         """
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             self_instance = args[0]
             raw_data = args[1]
-            crc_packet = int.from_bytes(raw_data[-1:], byteorder="little")
-            data_crc = self_instance.crc_sum(raw_data[:-1])
-            debug_message = f"of {func.__name__}: data:{data_crc}, crc-packet:{crc_packet}"
-            self_instance.get_logger().info("Checksum %s", debug_message)
+            crc_packet = raw_data[-1]
+            data_crc = self_instance.crc_sum(memoryview(raw_data)[:-1])
+            logger = self_instance.get_logger()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Checksum of %s: data:%s, crc-packet:%s",
+                    func.__name__,
+                    data_crc,
+                    crc_packet,
+                )
 
             if crc_packet != data_crc:
-                self_instance.error = self_instance.ERROR_CHECKSUM
-                self_instance.error_message = f"Error: checksum missmatch {debug_message}"
+                self_instance.error_code = self_instance.ERROR_CHECKSUM
+                self_instance.error_message = (
+                    f"Error: checksum missmatch of {func.__name__}: "
+                    f"data:{data_crc}, crc-packet:{crc_packet}"
+                )
 
             result = func(*args, **kwargs)
             return result
@@ -344,6 +522,34 @@ class BatteryInfo:
         """
         Read complete BMS information from the battery via Bluetooth.
 
+        Blocking wrapper that runs read_bms_async() in a new event loop.
+        See read_bms_async() for the command sequence, error handling and
+        side effects.
+
+        Returns:
+            None: Results are stored in instance attributes. Check error_code
+                to determine if the operation succeeded.
+
+        Raises:
+            BleakError, TimeoutError, Exception: Only raised if debug mode
+                is enabled (set_debug(True)).
+
+        Note:
+            This method blocks until completion. Inside a running event loop
+            await read_bms_async() instead.
+
+        Example:
+            >>> battery = BatteryInfo("12:34:56:78:AA:CC", timeout=5)
+            >>> battery.read_bms()
+            >>> if battery.error_code == 0:
+            ...     print(f"Battery OK: {battery.SOC}%")
+        """
+        asyncio.run(self.read_bms_async())
+
+    async def read_bms_async(self) -> None:
+        """
+        Read complete BMS information from the battery via Bluetooth.
+
         This is the main method for retrieving battery data. It establishes a
         Bluetooth connection, sends version and battery info commands, receives
         the responses, and parses them into the instance attributes.
@@ -381,12 +587,18 @@ class BatteryInfo:
             - Sets error_code and error_message on failure
 
         Note:
-            This method blocks until completion. For async usage, access
-            the Request instance directly via get_request().
+            This is the coroutine behind read_bms(). Await it directly to
+            poll several batteries concurrently on one event loop, each
+            over its own Bluetooth connection:
+
+            >>> await asyncio.gather(
+            ...     battery1.read_bms_async(),
+            ...     battery2.read_bms_async(),
+            ... )
 
         Example:
             >>> battery = BatteryInfo("12:34:56:78:AA:CC", timeout=5)
-            >>> battery.read_bms()
+            >>> await battery.read_bms_async()
             >>> if battery.error_code == 0:
             ...     print(f"Battery OK: {battery.SOC}%")
             ...     print(f"Voltage: {battery.voltage / 1000}V")
@@ -399,30 +611,29 @@ class BatteryInfo:
             ...     print(f"Error: {battery.error_message}")
         """
         try:
-            asyncio.run(
-                self._request.bulk_send(
-                    characteristic_id=self.BMS_CHARACTERISTIC_ID,
-                    commands_parsers={
-                        self.pq_commands["GET_VERSION"]: self.parse_version,
-                        self.pq_commands["GET_BATTERY_INFO"]: self.parse_battery_info,
-                        ## Internal SN not used or not implemented
-                        ## self.pq_commands["SERIAL_NUMBER"]: self.parse_serial_number
-                    },
-                )
+            await self._request.bulk_send(
+                characteristic_id=self.BMS_CHARACTERISTIC_ID,
+                commands_parsers={
+                    self._PQ_CMD_BYTES["GET_VERSION"]: self.parse_version,
+                    self._PQ_CMD_BYTES["GET_BATTERY_INFO"]: self.parse_battery_info,
+                    ## Internal SN not used or not implemented
+                    ## self._PQ_CMD_BYTES["SERIAL_NUMBER"]: self.parse_serial_number
+                },
             )
         except BleakError as e:
             self.error_code = self.ERROR_BLEAK
-            self.error_message = f"{e.__class__.__name__}: {e}"
+            ## Not the exception itself, which would keep its traceback alive
+            self._error = (e.__class__.__name__, str(e))
             if self._debug:
                 raise
         except TimeoutError as e:
             self.error_code = self.ERROR_TIMEOUT
-            self.error_message = f"{e.__class__.__name__}: {e}"
+            self._error = (e.__class__.__name__, str(e))
             if self._debug:
                 raise
         except Exception as e:
             self.error_code = self.ERROR_GENERIC
-            self.error_message = f"{e}"
+            self._error = (e.__class__.__name__, str(e))
             if self._debug:
                 raise
 
@@ -436,7 +647,9 @@ class BatteryInfo:
 
         Returns:
             str: JSON-formatted string containing all battery data.
-                The JSON is pretty-printed with 4-space indentation.
+                The JSON is pretty-printed with 4-space indentation, or
+                2-space indentation when the optional orjson package is
+                installed.
 
         JSON Structure:
             The returned JSON includes these key sections:
@@ -454,11 +667,6 @@ class BatteryInfo:
             Values are None until read_bms() is called successfully.
             The returned string can be parsed back with json.loads().
 
-        Warning:
-            This method modifies self.__dict__ by deleting internal keys.
-            Multiple calls in succession will work, but internal attributes
-            remain removed from the dict.
-
         Example:
             >>> battery = BatteryInfo("12:34:56:78:AA:CC")
             >>> battery.read_bms()
@@ -483,14 +691,16 @@ class BatteryInfo:
             >>> print(data["SOC"])
             85
         """
-        state = self.__dict__
-        del state["_logger"]
-        del state["_request"]
-        del state["_debug"]
+        state = {key: getattr(self, key) for key in _JSON_FIELDS}
 
-        return json.dumps(
-            state, default=lambda o: o.__dict__, sort_keys=False, indent=4
-        )
+        if orjson is not None:
+            return orjson.dumps(
+                state,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+
+        return json.dumps(state, default=_json_default, sort_keys=False, indent=4)
 
     @_check_crc
     def parse_battery_info(self, data: bytearray) -> None:
@@ -498,9 +708,8 @@ class BatteryInfo:
         Parse complete battery information from raw BMS response data.
 
         This method decodes the binary response from the GET_BATTERY_INFO (0x13)
-        command and populates all battery metric instance attributes. It handles
-        the complex byte ordering (little-endian with byte reversal) used by the
-        BMS protocol.
+        command and populates all battery metric instance attributes. All
+        multi-byte fields of the BMS protocol are little-endian.
 
         Args:
             data (bytearray): Raw response data from BMS, including header bytes
@@ -511,8 +720,8 @@ class BatteryInfo:
             None: Results are stored directly in instance attributes.
 
         Data Extraction Details:
-            All multi-byte values use reversed little-endian byte order.
-            The [::-1] slice reverses bytes before conversion.
+            All multi-byte values are little-endian. The whole payload is
+            decoded in a single pass with a precompiled struct.Struct.
 
             Voltage Extraction (bytes 8-47):
             - Pack voltage: bytes 8-11, value in millivolts
@@ -522,7 +731,8 @@ class BatteryInfo:
 
             Current & Power (bytes 48-51):
             - Current is signed (negative = discharging, positive = charging)
-            - Value in milliamps, converted to Amps
+            - Value stored in milliamps; the current and watt properties
+              convert to Amps and Watts on access
             - Watt calculated as: (voltage_mV * current_mA) / 1,000,000
 
             Temperature (bytes 52-55):
@@ -536,7 +746,7 @@ class BatteryInfo:
             State Flags (bytes 68-96):
             - Heat status (68-71): Self-heating and discharge switch state
             - Protection state (76-79): Active protections as hex
-            - Failure state (80-83): Fault indicators as list
+            - Failure state (80-83): Fault indicators as bytes
             - Equilibrium state (84-87): Cell balancing activity
             - Battery state (88-89): Operational mode
             - SOC (90-91): State of Charge percentage
@@ -548,7 +758,8 @@ class BatteryInfo:
 
         Discharge Switch State Logic:
             The discharge switch state is extracted from the heat status:
-            - If heat[6] (7th hex digit) >= 8: switch is OFF (0)
+            - If heat[6] (7th hex digit, bit 7 of byte 68) >= 8: switch
+              is OFF (0)
             - Otherwise: switch is ON (1)
             This represents the Bluetooth-controllable load disconnect.
 
@@ -564,94 +775,59 @@ class BatteryInfo:
             >>> # Called internally by read_bms(), not typically called directly
             >>> battery._check_crc(battery.parse_battery_info)(raw_data)
         """
-        self.packVoltage = int.from_bytes(data[8:12][::-1], byteorder="big")
-        self.voltage = int.from_bytes(data[12:16][::-1], byteorder="big")
-
-        batPack = data[16:48]
-        for key, dt in enumerate(batPack):
-            if key % 2:
-                continue
-
-            cellVoltage = int.from_bytes([batPack[key + 1], dt], byteorder="big")
-            if not cellVoltage:
-                continue
-            cell = int(key / 2 + 1)
-            self.batteryPack[cell] = cellVoltage / 1000
-
-        ## Load \ Unload current A
-        current = int.from_bytes(data[48:52][::-1], byteorder="big", signed=True)
-        self.current = round(current / 1000, 2)
-
-        ## Calculated load \ unload Watt
-        watt = round((self.voltage * +current) / 10000, 1) / 100
-        self.watt = round(watt, 2)
+        (
+            self.packVoltage,
+            self.voltage,
+            *cells,
+            self._current_mA,
+            self.cellTemperature,
+            self.mosfetTemperature,
+            remainAh,
+            fccAh,
+            heat,
+            protectState,
+            failureState,
+            self.equilibriumState,
+            self.batteryState,
+            self.SOC,
+            self.SOH,
+            self.dischargesCount,
+            self.dischargesAHCount,
+        ) = _BATTERY_INFO.unpack_from(data, 8)
+
+        ## Cells with 0 voltage are not present in the battery
+        self.batteryPack = {
+            cell: cellVoltage / 1000
+            for cell, cellVoltage in enumerate(cells, 1)
+            if cellVoltage
+        }
 
         ## Remain Ah
-        remainAh = int.from_bytes(data[62:64][::-1], byteorder="big")
         self.remainAh = round(remainAh / 100, 2)
 
         ## Factory Ah
-        fccAh = int.from_bytes(data[64:66][::-1], byteorder="big")
         self.factoryAh = round(fccAh / 100, 2)
 
-        ## Temperature
-        s = pow(2, 16)
-        self.cellTemperature = int.from_bytes(
-            data[52:54][::-1], byteorder="big", signed=True
-        )
-        self.mosfetTemperature = int.from_bytes(
-            data[54:56][::-1], byteorder="big", signed=True
-        )
-
-        self.heat = data[68:72][::-1].hex()
+        ## Flags as hex, most significant byte first
+        self.heat = f"{heat:08x}"
 
         ## Discharge switch state
-        ## State of internal bluetooth controlled discharge switch
-        if int(self.heat[6]) >= 8:
-            self.dischargeSwitchState = 0
-        else:
-            self.dischargeSwitchState = 1
-
-        self.protectState = data[76:80][::-1].hex()
-        self.failureState = list(data[80:84][::-1])
-        self.equilibriumState = int.from_bytes(data[84:88][::-1], byteorder="big")
-
-        ## Idle - 0 ??
-        ## Charging - 1
-        ## Discharging - 2
-        ## Full Charge - 4
-        self.batteryState = int.from_bytes(data[88:90][::-1], byteorder="big")
+        ## State of internal bluetooth controlled discharge switch,
+        ## high nibble of the lowest heat byte (heat[6]) >= 8 means off
+        self.dischargeSwitchState = 0 if heat & 0x80 else 1
 
-        ## State of charge (Charge level)
-        self.SOC = int.from_bytes(data[90:92][::-1], byteorder="big")
-
-        ## State of Health ??
-        self.SOH = int.from_bytes(data[92:96][::-1], byteorder="big")
-
-        self.dischargesCount = int.from_bytes(data[96:100][::-1], byteorder="big")
-
-        ## Discharge AH times
-        self.dischargesAHCount = int.from_bytes(data[100:104][::-1], byteorder="big")
+        self.protectState = f"{protectState:08x}"
+        self.failureState = failureState[::-1]
 
         ## Additional human readable statuses
         self.battery_status = self.get_battery_status()
 
-        if self.equilibriumState > 0:
-            self.balance_status = (
-                "Battery cells are being balanced for better performance."
-            )
-        else:
-            self.balance_status = "All cells are well-balanced."
-
-        if self.failureState[0] > 0 or self.failureState[1] > 0:
-            self.cell_status = "Fault alert! There may be a problem with cell."
-        else:
-            self.cell_status = "Battery is in optimal working condition."
-
-        if int(self.heat[7]) == 2:
-            self.heat_status = "Self-heating is on"
-        else:
-            self.heat_status = "Self-heating is off"
+        self.balance_status = _BALANCE_STATUS[self.equilibriumState > 0]
+        self.cell_status = _CELL_STATUS[
+            self.failureState[0] > 0 or self.failureState[1] > 0
+        ]
+        ## Low nibble of the lowest heat byte (heat[7])
+        self.heat_status = _HEAT_STATUS[heat & 0x0F == 2]
 
     @_check_crc
     def parse_version(self, data: bytearray) -> None:
@@ -674,10 +850,10 @@ class BatteryInfo:
                 - hardwareVersion (str): ASCII hardware identifier
 
         Data Layout (after 8-byte header):
-            Bytes 0-1: Major version number (2 bytes, reversed little-endian)
-            Bytes 2-3: Minor version number (2 bytes, reversed little-endian)
-            Bytes 4-5: Patch version number (2 bytes, reversed little-endian)
-            Bytes 6-7: Manufacturing year (2 bytes, reversed little-endian)
+            Bytes 0-1: Major version number (2 bytes, little-endian)
+            Bytes 2-3: Minor version number (2 bytes, little-endian)
+            Bytes 4-5: Patch version number (2 bytes, little-endian)
+            Bytes 6-7: Manufacturing year (2 bytes, little-endian)
             Byte 8: Manufacturing month (1 byte)
             Byte 9: Manufacturing day (1 byte)
 
@@ -703,25 +879,13 @@ class BatteryInfo:
             >>> print(f"Manufactured: {battery.manfactureDate}")
             Manufactured: 2023-5-15
         """
-        start = data[8:]
-        self.firmwareVersion = (
-            f"{int.from_bytes(start[0:2][::-1], byteorder='big')}"
-            f".{int.from_bytes(start[2:4][::-1], byteorder='big')}"
-            f".{int.from_bytes(start[4:6][::-1], byteorder='big')}"
-        )
-        self.manfactureDate = (
-            f"{int.from_bytes(start[6:8][::-1], byteorder='big')}"
-            f"-{int(start[8])}"
-            f"-{int(start[9])}"
-        )
+        major, minor, patch, year, month, day = _VERSION.unpack_from(data, 8)
+        self.firmwareVersion = f"{major}.{minor}.{patch}"
+        self.manfactureDate = f"{year}-{month}-{day}"
 
-        vers = ""
-        # rawV = data[0:8]
-        for ver in start[0::2]:
-            if 32 <= ver <= 126:
-                vers += chr(ver)
-
-        self.hardwareVersion = vers
+        self.hardwareVersion = (
+            data[8::2].translate(None, _NON_PRINTABLE).decode("ascii")
+        )
 
     def parse_serial_number(self, data: bytearray) -> None:
         """
@@ -735,7 +899,7 @@ class BatteryInfo:
             data (bytearray): Raw response data from BMS serial number command.
 
         Returns:
-            None: Currently only prints raw data to console.
+            None: Currently only logs the raw data at DEBUG level.
 
         Note:
             The PowerQueen mobile application (as of version 1.1.4) does not
@@ -751,9 +915,9 @@ class BatteryInfo:
         Example:
             >>> # Not typically used - command may not return valid data
             >>> battery.parse_serial_number(sn_data)
-            Serial number: $bytearray(...)
+            Serial number: bytearray(...)
         """
-        print(f"Serial number: ${data}")
+        self._logger.debug("Serial number: %s", data)
 
     def get_battery_status(self) -> str:
         """
@@ -786,18 +950,11 @@ class BatteryInfo:
             >>> print(f"Battery is: {status}")
             Battery is: Discharging
         """
-        status = ""
-        if self.current == 0:
-            status = "Standby"
-        elif self.current > 0:
-            status = "Charging"
-        elif self.current < 0:
-            status = "Discharging"
-
         if self.SOC >= 100 or self.batteryState == 4:
-            status = "Full Charge"
+            return _FULL_CHARGE
 
-        return status
+        current = self.current
+        return _BATTERY_STATUS[(current > 0) - (current < 0) + 1]
 
     def crc_sum(self, raw_data: bytearray) -> int:
         """
@@ -808,8 +965,8 @@ class BatteryInfo:
         checksum algorithm used by the PowerQueen BMS.
 
         Args:
-            raw_data (bytearray): The data bytes to checksum. Should include
-                all bytes except the trailing checksum byte.
+            raw_data (bytearray | memoryview): The data bytes to checksum.
+                Should include all bytes except the trailing checksum byte.
 
         Returns:
             int: 8-bit checksum value (0-255). Compare this with the checksum
@@ -822,12 +979,18 @@ class BatteryInfo:
             It provides basic error detection for transmission errors
             but is not as robust as true CRC algorithms.
 
+            For packets up to 256 bytes (all BMS responses) the byte sum
+            is taken from the low 16 bits of zlib.adler32(), which runs
+            in C without creating a Python int per byte.
+
         Example:
             >>> data = bytearray([0x00, 0x00, 0x04, 0x01, 0x13, 0x55, 0xAA])
             >>> checksum = battery.crc_sum(data)
             >>> print(f"Checksum: 0x{checksum:02X}")
             Checksum: 0x17
         """
+        if len(raw_data) <= _ADLER_SUM_MAX_LEN:
+            return ((zlib.adler32(raw_data) & 0xFFFF) - 1) & 0xFF
         return sum(raw_data) & 0xFF
 
     def get_logger(self) -> logging.Logger:
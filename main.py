@@ -65,6 +65,8 @@ Note:
     - Battery must be within Bluetooth range (typically <10 meters)
 """
 
+import os
+import re
 import sys
 import asyncio
 import logging
@@ -72,19 +74,123 @@ import argparse
 from battery import BatteryInfo
 
 
+## Shortest Bluetooth timeout (seconds) that still gives the BMS time to answer
+_MIN_TIMEOUT = 2
+
+
+## Bluetooth MAC address, or the device UUID CoreBluetooth uses on macOS
+_DEVICE_ADDRESS_RE = re.compile(
+    r"[0-9A-F]{2}(?::[0-9A-F]{2}){5}"
+    r"|[0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12}",
+    re.IGNORECASE,
+)
+
+
+def _device_address(value: str) -> str:
+    """
+    Validate the DEVICE_MAC argument and normalize it to upper case.
+
+    Malformed addresses are rejected while parsing arguments, before any
+    Bluetooth connection is attempted.
+
+    Args:
+        value (str): Raw command-line value.
+
+    Returns:
+        str: The upper-cased address.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is neither a MAC address
+            (12:34:56:78:AA:CC) nor a device UUID.
+    """
+    if not _DEVICE_ADDRESS_RE.fullmatch(value):
+        raise argparse.ArgumentTypeError(
+            f"invalid MAC address: {value!r} (expected format 12:34:56:78:AA:CC)"
+        )
+    return value.upper()
+
+
+def _timeout(value: str) -> int:
+    """
+    Parse the --timeout value, raising it to at least _MIN_TIMEOUT seconds.
+
+    Args:
+        value (str): Raw command-line value.
+
+    Returns:
+        int: Timeout in seconds, never below _MIN_TIMEOUT.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer.
+    """
+    try:
+        return max(_MIN_TIMEOUT, int(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid timeout: {value!r}") from None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for all supported CLI options.
+
+    The argument schema is static, so the parser is built once at import
+    time (see _PARSER) and reused by every commands() call.
+
+    Returns:
+        argparse.ArgumentParser: Parser configured with DEVICE_MAC, --bms,
+            --timeout, --pair, --services and --verbose.
+    """
+    parser = argparse.ArgumentParser(
+        description="PowerQueen LiFePO4 BMS Bluetooth Reader - "
+                    "Read battery information via Bluetooth Low Energy",
+        epilog="Example: python main.py 12:34:56:78:AA:CC --bms --timeout 5"
+    )
+    parser.add_argument(
+        "DEVICE_MAC",
+        help="Bluetooth device MAC address in format 12:34:56:78:AA:CC",
+        type=_device_address,
+    )
+
+    parser.add_argument("--bms", help="Get battery BMS info", action="store_true")
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        help=f"Bluetooth response timeout in seconds, minimum {_MIN_TIMEOUT} "
+        "(default: 4)",
+        type=_timeout,
+        default=4,
+    )
+    parser.add_argument(
+        "--pair", help="Pair with device before interacting", action="store_true"
+    )
+    parser.add_argument(
+        "-s",
+        "--services",
+        help="List device GATT services and characteristics",
+        action="store_true",
+    )
+    parser.add_argument("--verbose", help="Verbose logs", action="store_true")
+
+    return parser
+
+
+_PARSER = _build_parser()
+
+
 def commands() -> argparse.Namespace:
     """
     Parse and validate command-line arguments.
 
-    Configures an argument parser with all supported CLI options and
-    parses sys.argv to extract user-provided arguments. Returns a
-    Namespace object containing all parsed values.
+    Parses sys.argv with the module-level argument parser holding all
+    supported CLI options. Returns a Namespace object containing all
+    parsed values.
 
     Returns:
         argparse.Namespace: Parsed arguments with the following attributes:
-            - DEVICE_MAC (str): Bluetooth MAC address of the target device
+            - DEVICE_MAC (str): Bluetooth MAC address of the target device,
+              upper-cased
             - bms (bool): True if --bms flag was provided
-            - timeout (int): Bluetooth timeout in seconds
+            - timeout (int): Bluetooth timeout in seconds, at least 2
             - pair (bool): True if --pair flag was provided
             - services (bool): True if --services/-s flag was provided
             - verbose (bool): True if --verbose flag was provided
@@ -92,7 +198,9 @@ def commands() -> argparse.Namespace:
     Arguments Specification:
         DEVICE_MAC (positional, required):
             The Bluetooth MAC address of the PowerQueen battery.
-            Must be in format XX:XX:XX:XX:XX:XX where XX are hex bytes.
+            Must be in format XX:XX:XX:XX:XX:XX where XX are hex bytes
+            (or the device UUID on macOS), otherwise parsing fails before
+            any Bluetooth I/O. Normalized to upper case.
             Example: "12:34:56:78:AA:CC"
 
         --bms (optional, flag):
@@ -103,7 +211,7 @@ def commands() -> argparse.Namespace:
         -t/--timeout (optional, int, default=4):
             Bluetooth operation timeout in seconds. Increase this value
             if experiencing timeout errors due to weak signal or slow
-            BMS response. Minimum practical value is 2 seconds.
+            BMS response. Values below 2 seconds are raised to 2.
 
         --pair (optional, flag):
             When present, initiates Bluetooth pairing before communication.
@@ -125,38 +233,32 @@ def commands() -> argparse.Namespace:
         >>> print(f"Get BMS: {args.bms}")
         >>> print(f"Timeout: {args.timeout}s")
     """
-    parser = argparse.ArgumentParser(
-        description="PowerQueen LiFePO4 BMS Bluetooth Reader - "
-                    "Read battery information via Bluetooth Low Energy",
-        epilog="Example: python main.py 12:34:56:78:AA:CC --bms --timeout 5"
-    )
-    parser.add_argument(
-        "DEVICE_MAC",
-        help="Bluetooth device MAC address in format 12:34:56:78:AA:CC",
-        type=str,
-    )
+    return _PARSER.parse_args()
 
-    parser.add_argument("--bms", help="Get battery BMS info", action="store_true")
-    parser.add_argument(
-        "-t",
-        "--timeout",
-        help="Bluetooth response timeout in seconds (default: 4)",
-        type=int,
-        default=4,
-    )
-    parser.add_argument(
-        "--pair", help="Pair with device before interacting", action="store_true"
-    )
-    parser.add_argument(
-        "-s",
-        "--services",
-        help="List device GATT services and characteristics",
-        action="store_true",
-    )
-    parser.add_argument("--verbose", help="Verbose logs", action="store_true")
 
-    args = parser.parse_args()
-    return args
+async def _run(args: argparse.Namespace, battery: BatteryInfo) -> int:
+    """
+    Execute the requested BLE operations on a single event loop.
+
+    Runs the --services or --bms operation as a coroutine, so the whole CLI
+    invocation creates and tears down one event loop no matter how many
+    Bluetooth operations it performs.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+        battery (BatteryInfo): Battery configured from the arguments.
+
+    Returns:
+        int: Process exit code, 0 for --services, battery.error_code
+            for --bms.
+    """
+    if args.services:
+        await battery.get_request().print_services()
+        return 0
+
+    await battery.read_bms_async()
+    print(battery.get_json())
+    return battery.error_code
 
 
 def main() -> None:
@@ -174,7 +276,10 @@ def main() -> None:
         None: Results are printed to stdout. Exit code indicates success/failure.
 
     Exit Behavior:
-        The function calls sys.exit() with the following codes:
+        After the output is printed and stdout/stderr are flushed, the
+        process ends through os._exit(), skipping interpreter teardown
+        since the connection has already been closed. Because of this,
+        main() is only meant to be used as the CLI entry point. Exit codes:
         - 0: Success (always for --services, or --bms with no errors)
         - 1: Generic error (ERROR_GENERIC)
         - 2: Timeout error (ERROR_TIMEOUT)
@@ -183,17 +288,19 @@ def main() -> None:
 
     Logging Configuration:
         When --verbose is provided:
-        - Creates StreamHandler outputting to stdout
+        - Configures the root handler via logging.basicConfig(force=True)
+          to output to stdout
         - Uses format: "YYYY-MM-DD HH:MM:SS [function_name] message"
-        - Sets log level to DEBUG
-        - Attaches handler to module logger
+        - Sets the module logger level to DEBUG; other libraries keep the
+          default WARNING level
 
     Workflow:
         1. commands() parses CLI arguments
         2. If --verbose: configure logging
         3. Create BatteryInfo with MAC, pair, timeout, logger
-        4. If --services: print GATT services and exit 0
-        5. If --bms: read battery info, print JSON, exit with error_code
+        4. Run the requested operation on one event loop via _run():
+           - If --services: print GATT services and exit 0
+           - If --bms: read battery info, print JSON, exit with error_code
 
     Error Handling:
         Errors are handled internally by BatteryInfo.read_bms():
@@ -227,24 +334,25 @@ def main() -> None:
     logger = None
 
     if args.verbose:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter("%(asctime)s [%(funcName)s] %(message)s")
-        handler.setFormatter(formatter)
+        ## force=True replaces handlers from a previous call instead of
+        ## stacking them, which would duplicate every record
+        logging.basicConfig(
+            stream=sys.stdout,
+            format="%(asctime)s [%(funcName)s] %(message)s",
+            force=True,
+        )
         logger = logging.getLogger(__name__)
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(handler)
 
     battery = BatteryInfo(args.DEVICE_MAC, args.pair, args.timeout, logger)
 
-    if args.services:
-        request = battery.get_request()
-        asyncio.run(request.print_services())
-        sys.exit(0)
-
-    if args.bms:
-        battery.read_bms()
-        print(battery.get_json())
-        sys.exit(battery.error_code)
+    if args.services or args.bms:
+        exit_code = asyncio.run(_run(args, battery))
+        ## All Bluetooth resources are released by now, skip the interpreter
+        ## teardown (garbage collection of bleak/D-Bus objects, atexit hooks)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ BLE Communication Flow:
     4. Command bytes are written to the characteristic
     5. BMS processes command and sends response via notification
     6. Callback function is invoked with response data
-    7. Connection is closed and optionally unpaired
+    7. Connection is optionally unpaired and closed
 
 GATT Characteristics Used:
     - 0000FFE1-0000-1000-8000-00805F9B34FB: Primary BMS data read/write
@@ -52,8 +52,31 @@ Note:
 
 import asyncio
 import logging
+import functools
 from typing import Callable
-from bleak import BleakClient, BleakGATTCharacteristic
+from bleak import BleakClient, BleakError, BleakGATTCharacteristic
+
+try:
+    import uvloop
+except ImportError:  ## optional, faster event loop
+    uvloop = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## Every PowerQueen command is "00 00 04 01 <command ID> 55 AA <checksum>",
+## prebuilt for all 256 command IDs. The header and magic bytes sum to 0x104,
+## so the checksum is command ID + 4 (lowest 8 bits)
+_COMMANDS = tuple(
+    bytes((0x00, 0x00, 0x04, 0x01, opcode, 0x55, 0xAA, (opcode + 4) & 0xFF))
+    for opcode in range(256)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_command(command: str) -> bytes:
+    ## bytes.fromhex() skips the spaces between the hex pairs
+    return bytes.fromhex(command)
 
 
 class Request:
@@ -77,7 +100,11 @@ class Request:
             function for handling received data. Set before each command.
         bluetooth_timeout (int): Timeout in seconds for BLE operations.
             Applies to connection establishment and data transfer.
+        response_timeout (float): Upper bound in seconds for the wait on
+            each command response.
         logger (logging.Logger): Logger instance for debug output.
+        keep_alive (float | None): Seconds the connection stays open after
+            an operation, or None to disconnect after every operation.
 
     Thread Safety:
         This class is not thread-safe. All methods should be called from
@@ -97,6 +124,8 @@ class Request:
         pair_device: bool = False,
         timeout: int = 2,
         logger=None,
+        keep_alive: float | None = None,
+        response_timeout: float | None = None,
     ):
         """
         Initialize a Request instance for Bluetooth communication.
@@ -129,6 +158,21 @@ class Request:
             logger (logging.Logger | None, optional): Logger instance for
                 debug and info messages. If None, a module-level logger
                 is created automatically using __name__.
+            keep_alive (float | None, optional): Keep the connection open
+                for this many seconds after each send()/bulk_send(), so
+                consecutive calls within that window skip connection
+                setup. The connection belongs to the running event loop;
+                use it from a long-running loop and call close() before
+                the loop finishes, otherwise the link stays open until the
+                process exits and blocks other connects.
+                Defaults to None (connect and disconnect on every call).
+            response_timeout (float | None, optional): Longest time in
+                seconds to wait for the response to a command. This is an
+                upper bound, not a delay: the next command is sent as soon
+                as the response arrives, typically within a few connection
+                intervals (tens of milliseconds). Lowering it only shortens
+                the wait for responses that never come. Defaults to None
+                (same as timeout).
 
         Raises:
             No exceptions during initialization. Connection errors occur
@@ -152,14 +196,125 @@ class Request:
         self.pair = pair_device
         self.callback_func = None
         self.bluetooth_timeout = timeout
+        self.response_timeout = (
+            timeout if response_timeout is None else response_timeout
+        )
+        ## Set by _data_callback once a response has been handled
+        self._response_event = None
+        ## Exception raised by the parser of the current command
+        self._callback_error = None
+        ## Pipelined bulk_send(): command ID -> future of its response
+        self._pending_responses = None
+        ## Bound once, start_notify() gets the same handler object every time
+        self._bound_callback = self._data_callback
+
+        self.keep_alive = keep_alive
+        ## Persistent connection state, only used with keep_alive
+        self._client = None
+        self._client_lock = None
+        self._client_loop = None
+        self._idle_handle = None
+        self._close_task = None
+
+        self.logger = logger or _LOGGER
+
+    @staticmethod
+    def install_fast_loop() -> bool:
+        """
+        Make new asyncio event loops use uvloop, if it is installed.
 
-        if logger:
-            self.logger = logger
-        else:
-            self.logger = logging.getLogger(__name__)
+        Opt-in: call once at program start, before asyncio.run() or
+        read_bms(). uvloop lowers the per-callback scheduling overhead of
+        the event loop that dispatches BLE notifications. Nothing changes
+        when uvloop is not installed (it is not available on Windows).
+
+        Returns:
+            bool: True if uvloop was installed as event loop policy,
+                False if uvloop is not available.
+
+        Example:
+            >>> Request.install_fast_loop()
+            True
+            >>> battery = BatteryInfo("12:34:56:78:AA:CC")
+            >>> battery.read_bms()
+        """
+        if uvloop is None:
+            return False
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
+    @staticmethod
+    def make_command(opcode: int) -> bytes:
+        """
+        Return the complete 8-byte command frame for a command ID.
+
+        The frames are prebuilt when the module is imported, so this is a
+        plain lookup without any string parsing.
+
+        Args:
+            opcode (int): Command ID (byte 4 of the frame), 0x00-0xFF.
+                Example: 0x13 (GET_BATTERY_INFO)
+
+        Returns:
+            bytes: Command frame including magic bytes and checksum.
+
+        Raises:
+            ValueError: If opcode is outside 0x00-0xFF.
+
+        Example:
+            >>> Request.make_command(0x13).hex(" ")
+            '00 00 04 01 13 55 aa 17'
+        """
+        if not 0 <= opcode <= 0xFF:
+            raise ValueError(f"Command ID out of range: {opcode}")
+        return _COMMANDS[opcode]
+
+    async def send_opcode(
+        self,
+        characteristic_id: str,
+        opcode: int,
+        callback_func: Callable,
+        response: bool | None = None,
+    ) -> None:
+        """
+        Send a single command given by its command ID.
+
+        Same as send(), with the command frame built by make_command()
+        instead of parsed from a hex string.
+
+        Args:
+            characteristic_id (str): The UUID of the GATT characteristic.
+            opcode (int): Command ID, e.g. 0x16 (GET_VERSION).
+            callback_func (Callable): Function to call with the response data.
+            response (bool | None, optional): ATT write type, see
+                bulk_send(). Defaults to None (automatic).
+
+        Returns:
+            None: Response is delivered via the callback function.
+
+        Raises:
+            ValueError: If opcode is outside 0x00-0xFF.
+            BleakError: If Bluetooth connection or communication fails.
+            TimeoutError: If the connection or response times out.
+
+        Example:
+            >>> await request.send_opcode(
+            ...     "0000FFE1-0000-1000-8000-00805F9B34FB",
+            ...     0x13,
+            ...     handle_battery_info
+            ... )
+        """
+        await self.send(
+            characteristic_id, self.make_command(opcode), callback_func, response
+        )
 
     async def send(
-        self, characteristic_id: str, command: str, callback_func: Callable
+        self,
+        characteristic_id: str,
+        command: str | bytes,
+        callback_func: Callable,
+        response: bool | None = None,
     ) -> None:
         """
         Send a single command to the BLE device and receive response.
@@ -173,13 +328,16 @@ class Request:
                 write to. For PowerQueen BMS, use:
                 - "0000FFE1-0000-1000-8000-00805F9B34FB" for BMS data
                 - "0000FFE2-0000-1000-8000-00805F9B34FB" for serial number
-            command (str): The command to send as a space-separated hex string.
-                Each byte is represented as two hex digits.
+            command (str | bytes): The command to send as a space-separated
+                hex string, each byte represented as two hex digits, or as
+                already encoded bytes.
                 Example: "00 00 04 01 13 55 AA 17"
             callback_func (Callable): Function to call with the response data.
                 Signature: callback_func(data: bytearray) -> None
                 The callback is invoked when the BMS sends a notification
                 with the command response.
+            response (bool | None, optional): ATT write type, see
+                bulk_send(). Defaults to None (automatic).
 
         Returns:
             None: Response is delivered via the callback function.
@@ -199,10 +357,18 @@ class Request:
             ... )
         """
         await self.bulk_send(
-            characteristic_id, commands_parsers={command: callback_func}
+            characteristic_id,
+            commands_parsers={command: callback_func},
+            response=response,
         )
 
-    async def bulk_send(self, characteristic_id: str, commands_parsers: dict) -> None:
+    async def bulk_send(
+        self,
+        characteristic_id: str,
+        commands_parsers: dict,
+        response: bool | None = None,
+        pipeline: bool = False,
+    ) -> None:
         """
         Send multiple commands to the BLE device in sequence.
 
@@ -216,43 +382,75 @@ class Request:
             commands_parsers (dict): Dictionary mapping command strings to
                 callback functions. Commands are sent in dictionary iteration
                 order (insertion order in Python 3.7+).
-                Keys: Command strings (space-separated hex bytes)
+                Keys: Command strings (space-separated hex bytes) or
+                    already encoded command bytes
                 Values: Callback functions (Callable[[bytearray], None])
+            response (bool | None, optional): ATT write type used for the
+                commands. True waits for the ATT Write Response of every
+                write, False uses Write Without Response. None picks Write
+                Without Response when the characteristic supports it, since
+                the BMS answers through a notification anyway, and falls
+                back to Write With Response otherwise. Pass True to get an
+                explicit link-layer acknowledgement for each command.
+                Defaults to None.
+            pipeline (bool, optional): Write all commands back-to-back
+                instead of waiting for each response before the next write.
+                Responses are matched to their command by the command ID
+                (byte 4), which the BMS echoes in the response header, so
+                every command must have a different command ID.
+                Defaults to False.
 
         Returns:
             None: Responses are delivered via respective callback functions.
+                Without commands, nothing is sent and no connection is made.
 
         Raises:
             BleakError: If Bluetooth connection or communication fails.
             TimeoutError: If any operation times out.
+            ValueError: If a command string contains invalid hex digits, or
+                pipeline is True and a command is shorter than 5 bytes or
+                two commands share a command ID. All are checked before
+                connecting.
+            Exception: The first exception raised by a parser, after all
+                commands have been sent and the connection was closed
+                (or returned to keep_alive).
 
         Communication Flow:
-            1. Connect to device with configured timeout
-            2. Optionally pair if pair=True
-            3. For each command:
-               a. Register notification handler with callback
+            1. Encode and validate all commands
+            2. Connect to device with configured timeout
+            3. Optionally pair if pair=True
+            4. Pick the write type and register the notification handler once
+            5. For each command:
+               a. Route notifications to the command's callback
                b. Write command bytes to characteristic
-               c. Wait 1 second for response
-               d. Stop notification listening
-            4. Disconnect from device
-            5. Optionally unpair if paired
+               c. Wait until the response notification has been handled,
+                  at most response_timeout seconds
+            6. Stop notification listening
+            7. Optionally unpair if paired
+            8. Disconnect from device
 
         Timing:
-            Each command has a 1-second wait period for the response. Total
-            execution time is approximately: connection_time + (n_commands * 1s)
-            + disconnection_time.
+            Each command waits only as long as the BMS takes to respond.
+            Total execution time is approximately: connection_time +
+            (n_commands * response_time) + disconnection_time. A command
+            without response is logged and skipped after response_timeout
+            seconds; the remaining commands are still sent.
 
         Note:
-            Commands are sent sequentially, not concurrently. Each command
-            completes before the next begins. This matches the BMS's
-            single-threaded command processing.
+            By default commands are sent sequentially, not concurrently.
+            Each command completes before the next begins. This matches the
+            BMS's single-threaded command processing. With pipeline=True the
+            total time drops to about one response time for all commands,
+            provided the BMS queues commands that arrive while it is busy;
+            commands whose response is lost are logged after
+            response_timeout seconds like in sequential mode.
 
         Example:
             >>> def parse_version(data):
             ...     print(f"Version: {data[8:14]}")
             ...
             >>> def parse_battery(data):
-            ...     voltage = int.from_bytes(data[8:12][::-1], 'big')
+            ...     voltage = int.from_bytes(data[8:12], 'little')
             ...     print(f"Voltage: {voltage}mV")
             ...
             >>> commands = {
@@ -264,6 +462,25 @@ class Request:
             ...     commands
             ... )
         """
+        ## Fail on malformed commands before spending a connection on them
+        commands = [
+            (self._create_command(commandStr), parser)
+            for commandStr, parser in commands_parsers.items()
+        ]
+        if not commands:
+            return
+        if pipeline:
+            if any(len(command) <= 4 for command, _ in commands):
+                raise ValueError("Pipelined commands need a command ID at byte 4")
+            if len({command[4] for command, _ in commands}) != len(commands):
+                raise ValueError("Pipelined commands need distinct command IDs")
+
+        if self.keep_alive is not None:
+            await self._bulk_send_keep_alive(
+                characteristic_id, commands, response, pipeline
+            )
+            return
+
         self.logger.info(
             "Connecting to %s... (timeout: %s)",
             self.bluetooth_device_mac,
@@ -275,26 +492,429 @@ class Request:
             if self.pair:
                 self.logger.info("Pairing %s...", self.bluetooth_device_mac)
                 await client.pair()
+            await self._log_mtu(client)
+            parser_error = await self._send_commands(
+                client, characteristic_id, commands, response, pipeline
+            )
+
+            if self.pair:
+                await client.unpair()
+            ## Leaving the context disconnects the client
+            self.logger.info("Disconnecting %s...", self.bluetooth_device_mac)
+        self.logger.info("Disconnected %s", self.bluetooth_device_mac)
+
+        if parser_error is not None:
+            raise parser_error
+
+    async def _bulk_send_keep_alive(
+        self,
+        characteristic_id: str,
+        commands: list,
+        response: bool | None,
+        pipeline: bool,
+    ) -> None:
+        """
+        Send commands over the persistent connection (keep_alive mode).
+
+        Internal helper of bulk_send(). Operations are serialized with a
+        lock, so concurrent calls share the connection one after another.
+        The idle timer is stopped while commands are sent and restarted
+        afterwards; if sending fails, the connection is closed since its
+        state is unknown.
+
+        Args:
+            characteristic_id (str): The UUID of the GATT characteristic.
+            commands (list): Encoded (command bytes, parser) pairs in
+                sending order.
+            response (bool | None): ATT write type, see bulk_send().
+            pipeline (bool): Pipelined sending, see bulk_send().
+
+        Returns:
+            None: Responses are delivered via respective callback functions.
+        """
+        loop = asyncio.get_running_loop()
+        self._bind_loop(loop)
+
+        async with self._client_lock:
+            if self._idle_handle is not None:
+                self._idle_handle.cancel()
+                self._idle_handle = None
+
+            try:
+                client = await self._ensure_client()
+                parser_error = await self._send_commands(
+                    client, characteristic_id, commands, response, pipeline
+                )
+            except BaseException:
+                try:
+                    await self._disconnect_client()
+                except Exception as cleanup_error:
+                    ## Keep the original error, it is the one worth raising
+                    self.logger.warning(
+                        "Closing connection to %s after error failed: %s",
+                        self.bluetooth_device_mac,
+                        cleanup_error,
+                    )
+                raise
+
+            self._idle_handle = loop.call_later(self.keep_alive, self._close_idle)
+
+        ## The connection itself is fine, a parser failed on its response
+        if parser_error is not None:
+            raise parser_error
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Tie the persistent connection state to the running event loop.
+
+        A client connected in another event loop, e.g. a previous
+        asyncio.run(), can neither be used nor disconnected from this one.
+        It is dropped with a warning, since its link stays open at the
+        Bluetooth stack level until the process exits and the BMS accepts
+        only one central. Its idle timer is cancelled as well.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+
+        Returns:
+            None
+        """
+        if self._client_loop is loop:
+            return
+
+        if self._client is not None and self._client.is_connected:
+            self.logger.warning(
+                "Dropping the keep_alive connection to %s opened in another "
+                "event loop, it stays open until the process exits. "
+                "Call close() before that event loop finishes.",
+                self.bluetooth_device_mac,
+            )
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self._client_loop = loop
+
+    async def _ensure_client(self) -> BleakClient:
+        """
+        Return the persistent client, connecting it first if needed.
+
+        Returns:
+            BleakClient: Connected (and, if pair=True, paired) client.
+
+        Raises:
+            BleakError: If Bluetooth connection fails.
+            TimeoutError: If connection times out.
+        """
+        if self._client is not None and self._client.is_connected:
+            return self._client
+
+        self.logger.info(
+            "Connecting to %s... (timeout: %s)",
+            self.bluetooth_device_mac,
+            self.bluetooth_timeout,
+        )
+        client = BleakClient(
+            self.bluetooth_device_mac, timeout=self.bluetooth_timeout
+        )
+        await client.connect()
+        try:
+            if self.pair:
+                self.logger.info("Pairing %s...", self.bluetooth_device_mac)
+                await client.pair()
+            await self._log_mtu(client)
+        except BaseException:
+            try:
+                await client.disconnect()
+            except Exception as cleanup_error:
+                self.logger.warning(
+                    "Closing connection to %s after error failed: %s",
+                    self.bluetooth_device_mac,
+                    cleanup_error,
+                )
+            raise
+
+        self._client = client
+        return client
+
+    def _close_idle(self) -> None:
+        """
+        Close the persistent connection once keep_alive seconds passed idle.
+
+        Scheduled with loop.call_later() after each keep_alive operation.
+        The connection is closed in a task that waits for the client lock,
+        so an operation that started in the meantime is never interrupted.
+
+        Returns:
+            None
+        """
+        self._idle_handle = None
+        self._close_task = asyncio.ensure_future(self._close_idle_client(self._client))
+        self._close_task.add_done_callback(self._close_idle_done)
+
+    async def _close_idle_client(self, client: BleakClient | None) -> None:
+        """
+        Close client if it is still the idle persistent connection.
+
+        Args:
+            client (BleakClient | None): The client the idle timer was
+                armed for.
+
+        Returns:
+            None
+        """
+        async with self._client_lock:
+            ## An operation ran while this task waited for the lock: it either
+            ## re-armed the idle timer or replaced/closed the client
+            if self._idle_handle is not None or self._client is not client:
+                return
+            await self._disconnect_client()
+
+    def _close_idle_done(self, task: asyncio.Task) -> None:
+        """
+        Log a failure of the idle close task instead of leaving it unretrieved.
+
+        Args:
+            task (asyncio.Task): The finished idle close task.
+
+        Returns:
+            None
+        """
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self.logger.warning(
+                "Closing idle connection to %s failed: %s",
+                self.bluetooth_device_mac,
+                exc,
+            )
+
+    async def close(self) -> None:
+        """
+        Close the persistent connection kept open by keep_alive.
+
+        Safe to call at any time; does nothing when no connection is open.
+        Waits for a running operation to finish first. Call it before the
+        event loop finishes: the idle timer cannot fire once the loop has
+        stopped, and a connection left open then cannot be closed from
+        another event loop.
+
+        Returns:
+            None
+
+        Example:
+            >>> request = Request("12:34:56:78:AA:CC", keep_alive=30)
+            >>> try:
+            ...     await request.bulk_send(char_id, commands)
+            ...     await request.bulk_send(char_id, commands)
+            ... finally:
+            ...     await request.close()
+        """
+        self._bind_loop(asyncio.get_running_loop())
+        async with self._client_lock:
+            await self._disconnect_client()
+
+    async def _disconnect_client(self) -> None:
+        """
+        Stop the idle timer and disconnect the persistent client.
+
+        The caller must hold the client lock.
+
+        Returns:
+            None
+        """
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+        client, self._client = self._client, None
+        if client is None or not client.is_connected:
+            return
+
+        self.logger.info("Disconnecting %s...", self.bluetooth_device_mac)
+        try:
+            if self.pair:
+                await client.unpair()
+        finally:
+            ## A failed unpair must not leave the link open
+            await client.disconnect()
+        self.logger.info("Disconnected %s", self.bluetooth_device_mac)
+
+    async def _send_commands(
+        self,
+        client: BleakClient,
+        characteristic_id: str,
+        commands: list,
+        response: bool | None,
+        pipeline: bool,
+    ) -> Exception | None:
+        """
+        Send commands over a connected client and dispatch the responses.
+
+        Internal helper of bulk_send(), covering everything between
+        connecting and disconnecting. The characteristic is looked up once
+        and the resolved object is used for all notify and write calls,
+        instead of bleak resolving the UUID string on every call.
+
+        An exception raised by a parser does not stop the remaining
+        commands. The first one is returned, so the caller can raise it
+        once the connection has been handled as usual.
+
+        Args:
+            client (BleakClient): Connected client.
+            characteristic_id (str): The UUID of the GATT characteristic.
+            commands (list): Encoded (command bytes, parser) pairs in
+                sending order.
+            response (bool | None): ATT write type, see bulk_send().
+            pipeline (bool): Pipelined sending, see bulk_send().
+
+        Returns:
+            Exception | None: The first exception raised by a parser, or
+                None. Responses are delivered via respective callback
+                functions.
 
-            for commandStr, parser in commands_parsers.items():
-                command = self._create_command(commandStr)
+        Raises:
+            BleakError: If the device has no characteristic_id characteristic.
+        """
+        characteristic = client.services.get_characteristic(characteristic_id)
+        if characteristic is None:
+            raise BleakError(f"Characteristic {characteristic_id} was not found")
+
+        if response is None:
+            response = "write-without-response" not in characteristic.properties
+
+        parser_error = None
+        self._response_event = asyncio.Event()
+        await client.start_notify(characteristic, self._bound_callback)
+        if pipeline:
+            parser_error = await self._pipelined_send(
+                client, characteristic, commands, response
+            )
+        else:
+            for command, parser in commands:
                 self.callback_func = parser
+                self._callback_error = None
+                self._response_event.clear()
 
-                await client.start_notify(characteristic_id, self._data_callback)
                 self.logger.info("Sending command: %s", command)
                 result = await client.write_gatt_char(
-                    characteristic_id, data=command, response=True
+                    characteristic, data=command, response=response
                 )
-                await asyncio.sleep(1.0)
+                try:
+                    await asyncio.wait_for(
+                        self._response_event.wait(),
+                        timeout=self.response_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        "No response to command %s within %s s",
+                        command,
+                        self.response_timeout,
+                    )
 
                 self.logger.info("Raw result: %s", result)
-                await client.stop_notify(characteristic_id)
+                if parser_error is None:
+                    parser_error = self._callback_error
+                self._callback_error = None
 
-        self.logger.info("Disconnecting %s...", self.bluetooth_device_mac)
-        if self.pair:
-            client.unpair()
-        await client.disconnect()
-        self.logger.info("Disconnected %s", self.bluetooth_device_mac)
+        await client.stop_notify(characteristic)
+        return parser_error
+
+    async def _pipelined_send(
+        self,
+        client: BleakClient,
+        characteristic: BleakGATTCharacteristic,
+        commands: list,
+        response: bool,
+    ) -> Exception | None:
+        """
+        Write all commands back-to-back and dispatch the responses.
+
+        Internal helper of bulk_send(pipeline=True). A future is registered
+        per command ID (bulk_send() checks they are distinct) before the
+        first write; _data_callback resolves the future whose ID matches
+        byte 4 of the notification. Once every future is resolved, or
+        response_timeout seconds have passed, the responses are handed to
+        their parsers in command order. As in sequential mode, a parser
+        exception does not stop the other parsers; the first one is
+        returned.
+
+        Args:
+            client (BleakClient): Connected client with notifications
+                already started on characteristic.
+            characteristic (BleakGATTCharacteristic): Resolved command
+                characteristic.
+            commands (list): (command bytes, parser) pairs in sending
+                order.
+            response (bool): ATT write type for write_gatt_char().
+
+        Returns:
+            Exception | None: The first exception raised by a parser, or
+                None. Responses are delivered via respective callback
+                functions.
+        """
+        loop = asyncio.get_running_loop()
+        futures = {command[4]: loop.create_future() for command, _ in commands}
+
+        self._pending_responses = futures
+        try:
+            for command, _ in commands:
+                self.logger.info("Sending command: %s", command)
+                await client.write_gatt_char(
+                    characteristic, data=command, response=response
+                )
+            await asyncio.wait(futures.values(), timeout=self.response_timeout)
+        finally:
+            self._pending_responses = None
+
+        parser_error = None
+        for command, parser in commands:
+            future = futures[command[4]]
+            if future.done():
+                try:
+                    parser(future.result())
+                except Exception as e:
+                    if parser_error is None:
+                        parser_error = e
+            else:
+                future.cancel()
+                self.logger.warning(
+                    "No response to command %s within %s s",
+                    command,
+                    self.response_timeout,
+                )
+        return parser_error
+
+    async def _log_mtu(self, client: BleakClient) -> None:
+        """
+        Log the ATT MTU negotiated for the connection.
+
+        The MTU is exchanged by the operating system's Bluetooth stack when
+        the connection is set up; bleak offers no API to request a larger
+        one. On BlueZ, bleak only knows the real value after
+        _acquire_mtu() (one extra D-Bus call), so it is queried only when
+        the message would actually be logged. Backends without
+        _acquire_mtu() report their value directly.
+
+        Args:
+            client (BleakClient): Connected client.
+
+        Returns:
+            None
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        acquire_mtu = getattr(getattr(client, "_backend", None), "_acquire_mtu", None)
+        if acquire_mtu is not None:
+            try:
+                await acquire_mtu()
+            except Exception as e:
+                self.logger.debug("Could not acquire MTU: %s", e)
+
+        self.logger.info("ATT MTU: %s", client.mtu_size)
 
     async def print_services(self) -> None:
         """
@@ -317,7 +937,7 @@ class Request:
             - Service UUID and description
             - List of characteristics with their UUIDs
             - Current value of each readable characteristic
-            - Error message for unreadable characteristics
+            - Error message for readable characteristics that fail to read
 
         Use Cases:
             - Discover available characteristics on new devices
@@ -329,10 +949,9 @@ class Request:
             >>> request = Request("12:34:56:78:AA:CC")
             >>> await request.print_services()
             0000ffe0-0000-1000-8000-00805f9b34fb (Handle: 1): Unknown
-                characteristic: $0000ffe1-0000-1000-8000-00805f9b34fb
+                characteristic: $0000ffe1-0000-1000-8000-00805f9b34fb (read, write-without-response, write, notify)
                 bytearray(b'...')
-                characteristic: $0000ffe2-0000-1000-8000-00805f9b34fb
-                Error: Characteristic not readable
+                characteristic: $0000ffe2-0000-1000-8000-00805f9b34fb (write)
         """
         async with BleakClient(
             self.bluetooth_device_mac, timeout=self.bluetooth_timeout
@@ -340,12 +959,13 @@ class Request:
             if self.pair:
                 self.logger.info("Pairing %s...", self.bluetooth_device_mac)
                 await client.pair()
+            await self._log_mtu(client)
             await self.parse_services(client, client.services)
 
-        self.logger.info("Disconnecting %s...", self.bluetooth_device_mac)
-        if self.pair:
-            await client.unpair()
-        await client.disconnect()
+            if self.pair:
+                await client.unpair()
+            ## Leaving the context disconnects the client
+            self.logger.info("Disconnecting %s...", self.bluetooth_device_mac)
         self.logger.info("Disconnected %s", self.bluetooth_device_mac)
 
     async def parse_services(
@@ -355,8 +975,10 @@ class Request:
         Parse and print GATT services and their characteristics.
 
         Iterates through all BLE services and characteristics, printing
-        their information and attempting to read values. This is a helper
-        method called by print_services().
+        their information and the values of readable characteristics. All
+        reads are issued concurrently, so the D-Bus/HCI round trips overlap
+        instead of adding up. This is a helper method called by
+        print_services().
 
         Args:
             client (BleakClient): Active Bleak client connection to the device.
@@ -370,11 +992,14 @@ class Request:
         Output Details:
             - Service line: Shows service UUID and handle
             - Characteristic line: Shows characteristic UUID with $ prefix
+              and its properties (read, write, write-without-response,
+              notify, ...)
             - Value line: Shows raw bytearray data if readable
             - Error line: Shows exception message if read fails
 
         Note:
-            Some characteristics are write-only or require pairing to read.
+            Characteristics without the "read" property are not read, only
+            listed. Some readable characteristics require pairing to read.
             Errors reading individual characteristics do not stop enumeration;
             the method continues with remaining characteristics.
 
@@ -382,16 +1007,36 @@ class Request:
             >>> async with BleakClient(mac) as client:
             ...     await request.parse_services(client, client.services)
         """
+        services = list(services)
+        readable = [
+            charc
+            for service in services
+            for charc in service.characteristics
+            if "read" in charc.properties
+        ]
+        results = await asyncio.gather(
+            *(client.read_gatt_char(charc) for charc in readable),
+            return_exceptions=True,
+        )
+        values = {charc.handle: result for charc, result in zip(readable, results)}
+
+        ## Collect the listing and print it at once, instead of one print()
+        ## per line on the event loop
+        lines = []
         for service in services:
-            print(service)
+            lines.append(str(service))
             for charc in service.characteristics:
-                print(f"\tcharacteristic: ${charc}")
-                try:
-                    result = await client.read_gatt_char(charc)
-                    print(f"\t{result}")
+                properties = ", ".join(charc.properties)
+                lines.append(f"\tcharacteristic: ${charc} ({properties})")
+                if charc.handle not in values:
+                    continue
+                result = values[charc.handle]
+                if isinstance(result, Exception):
+                    lines.append(f"\tError: {result}")
+                else:
+                    lines.append(f"\t{result}")
                     ## print("Model Number: {0}".format("".join(map(chr, model_number))))
-                except Exception as e:
-                    print(f"\tError: {e}")
+        print("\n".join(lines))
 
     def _set_callback(self, callback_func: Callable) -> None:
         """
@@ -414,25 +1059,30 @@ class Request:
         """
         self.callback_func = callback_func
 
-    def _create_command(self, command: str) -> bytearray:
+    def _create_command(self, command: str | bytes | bytearray) -> bytes:
         """
-        Convert a hex string command to a bytearray for BLE transmission.
+        Convert a hex string command to bytes for BLE transmission.
 
-        Parses a space-separated string of hexadecimal bytes and converts
-        it to a bytearray suitable for writing to a BLE characteristic.
+        Parses a space-separated string of hexadecimal bytes with
+        bytes.fromhex() and returns bytes suitable for writing to a BLE
+        characteristic. Encoded strings are cached, so polling the same
+        commands repeatedly parses each string only once. Commands given as
+        bytes are returned unchanged; a bytearray is copied to bytes once,
+        so the caller cannot modify a command while it is being sent.
 
         Args:
-            command (str): Space-separated hex string. Each byte is
-                represented as two hex digits (uppercase or lowercase).
+            command (str | bytes | bytearray): Space-separated hex string.
+                Each byte is represented as two hex digits (uppercase or
+                lowercase), or already encoded command bytes.
                 Example: "00 00 04 01 13 55 AA 17"
 
         Returns:
-            bytearray: Binary command data ready for BLE transmission.
-                The returned bytearray has one byte per hex pair in
-                the input string.
+            bytes: Binary command data ready for BLE transmission.
+                The returned bytes have one byte per hex pair in the
+                input string.
 
         Conversion:
-            "00 00 04 01 13 55 AA 17" -> bytearray([0, 0, 4, 1, 19, 85, 170, 23])
+            "00 00 04 01 13 55 AA 17" -> b"\\x00\\x00\\x04\\x01\\x13U\\xaa\\x17"
 
         Raises:
             ValueError: If the string contains invalid hex digits.
@@ -440,14 +1090,16 @@ class Request:
         Example:
             >>> cmd = request._create_command("00 00 04 01 13 55 AA 17")
             >>> print(cmd.hex())
-            0000040113550aa17
+            000004011355aa17
             >>> print(list(cmd))
             [0, 0, 4, 1, 19, 85, 170, 23]
         """
-        command_bytes = [int(el, 16) for el in command.split(" ")]
-        message_bytes = bytearray(command_bytes)
+        if isinstance(command, bytes):
+            return command
+        if isinstance(command, bytearray):
+            return bytes(command)
 
-        return message_bytes
+        return _encode_command(command)
 
     async def _data_callback(
         self, sender: BleakGATTCharacteristic, data: bytearray
@@ -466,28 +1118,55 @@ class Request:
                 complete response packet including headers and checksum.
 
         Returns:
-            None: Data is forwarded to self.callback_func.
+            None: Data is forwarded to self.callback_func, then the pending
+                bulk_send() command is marked as answered.
 
         Logging:
-            When logger is at INFO level or below, logs:
+            When logger is at DEBUG level, logs:
             - The name of the callback function being invoked
-            - The characteristic ID that sent the data
+            - The handle of the characteristic that sent the data
             - The raw data bytes in hex format
+            The message is only formatted when DEBUG is enabled, keeping
+            the notification path cheap otherwise.
 
         Flow:
             1. Receives notification from BLE stack
             2. Logs the callback details
             3. Invokes self.callback_func with the raw data
-            4. Callback function parses and stores the data
+            4. Callback function parses and stores the data; an exception
+               it raises is kept for bulk_send() to raise
 
         Note:
             The callback_func must be set before starting notifications.
-            This is handled automatically by send() and bulk_send().
+            This is handled automatically by send() and bulk_send(). While
+            a pipelined bulk_send() is running, the data resolves the
+            pending future of its command ID instead.
         """
-        self.logger.info(
-            "Function: %s\n characteristic_id: %s\n Raw data: %s",
-            self.callback_func.__name__,
-            sender,
-            data,
-        )
-        self.callback_func(data)
+        if self._pending_responses is not None:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Notification from handle %s: %s", sender.handle, data.hex()
+                )
+            future = self._pending_responses.get(data[4]) if len(data) > 4 else None
+            if future is None:
+                self.logger.warning("Unexpected notification: %s", data)
+            elif not future.done():
+                future.set_result(data)
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Notification from handle %s for %s: %s",
+                sender.handle,
+                self.callback_func.__name__,
+                data.hex(),
+            )
+        try:
+            self.callback_func(data)
+        except Exception as e:
+            ## Raised by bulk_send() once the command sequence is done
+            self._callback_error = e
+        finally:
+            ## The command has been answered, even if parsing failed
+            if self._response_event is not None:
+                self._response_event.set()